@@ -229,6 +229,7 @@ class Database(_ItemFetcher):
     Uses :class:`ItemFetcher` to fetch and cache the full database schema, including all tables, columns and their
     types.
     """
+    __slots__ = ('__client', '__name')
     __client: PyKustoClientBase
     __name: str
 
@@ -328,6 +329,7 @@ class Table(_ItemFetcher):
     Handle to a Kusto table.
     Uses :class:`ItemFetcher` to fetch and cache the table schema of columns and their types.
     """
+    __slots__ = ('__database', '__tables')
     __database: Database
     __tables: Tuple[str, ...]
 
@@ -23,7 +23,9 @@ OrderedType = Union[ComparableType, StringType]
 # All classes in the same file to prevent circular dependencies
 
 class BaseExpression:
+    __slots__ = ('kql', '__sub', '__weakref__')
     kql: KQL
+    __sub: Optional[KQL]
 
     # We would prefer to use 'abc' to make the class abstract, but this can be done only if there is at least one
     # abstract method, which we don't have here. Overriding __new___ is the next best solution.
@@ -32,6 +34,8 @@ class BaseExpression:
         return object.__new__(cls)
 
     def __init__(self, kql: Union[KQL, 'BaseExpression']) -> None:
+        # Set first, otherwise an unset slot falls through to '_MappingExpression.__getattr__'
+        self.__sub = None
         if isinstance(kql, BaseExpression):
             self.kql = kql.kql
             return
@@ -49,7 +53,10 @@ class BaseExpression:
         )
 
     def as_subexpression(self) -> KQL:
-        return KQL(f'({self.kql})')
+        # Expressions are immutable, so this is built at most once
+        if self.__sub is None:
+            self.__sub = KQL(f'({self.kql})')
+        return self.__sub
 
     def get_type(self) -> '_StringExpression':
         return _StringExpression(KQL(f'gettype({self.kql})'))
@@ -84,13 +91,7 @@ class BaseExpression:
     def base_binary_op(
             left: ExpressionType, operator: str, right: ExpressionType, result_type: Optional[_KustoType]
     ) -> 'BaseExpression':
-        registrar = _plain_expression
-        fallback = AnyExpression
-        if isinstance(left, AggregationExpression) or isinstance(right, AggregationExpression):
-            registrar = _aggregation_expression
-            fallback = _AnyAggregationExpression
-        return_type = fallback if result_type is None else registrar.registry[result_type]
-        return return_type(KQL(f'{_to_kql(left, True)}{operator}{_to_kql(right, True)}'))
+        return _binary_op(left, operator, right, result_type)
 
     def __eq__(self, other: ExpressionType) -> '_BooleanExpression':
         return _BooleanExpression.binary_op(self, ' == ', other)
@@ -197,10 +198,12 @@ class BaseExpression:
 
 @_plain_expression(_KustoType.BOOL)
 class _BooleanExpression(BaseExpression):
+    __slots__ = ()
+
     @staticmethod
     def binary_op(left: ExpressionType, operator: str, right: ExpressionType) -> '_BooleanExpression':
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(left, operator, right, _KustoType.BOOL)
+        return _binary_op(left, operator, right, _KustoType.BOOL)
 
     def __and__(self, other: BooleanType) -> '_BooleanExpression':
         """
@@ -236,10 +239,12 @@ class _BooleanExpression(BaseExpression):
 
 @_plain_expression(*_NUMBER_TYPES)
 class _NumberExpression(BaseExpression):
+    __slots__ = ()
+
     @staticmethod
     def binary_op(left: NumberType, operator: str, right: NumberType) -> '_NumberExpression':
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(left, operator, right, _KustoType.INT)
+        return _binary_op(left, operator, right, _KustoType.INT)
 
     def __lt__(self, other: NumberType) -> _BooleanExpression:
         return _BooleanExpression.binary_op(self, ' < ', other)
@@ -409,6 +414,8 @@ class _NumberExpression(BaseExpression):
 
 @_plain_expression(_KustoType.STRING, _KustoType.GUID)
 class _StringExpression(BaseExpression):
+    __slots__ = ()
+
     # We would like to allow using len(), but Python requires it to return an int, so we can't
     def string_size(self) -> _NumberExpression:
         """
@@ -535,10 +542,12 @@ class _StringExpression(BaseExpression):
 
 @_plain_expression(_KustoType.DATETIME)
 class _DatetimeExpression(BaseExpression):
+    __slots__ = ()
+
     @staticmethod
     def binary_op(left: ExpressionType, operator: str, right: ExpressionType) -> '_DatetimeExpression':
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(left, operator, right, _KustoType.DATETIME)
+        return _binary_op(left, operator, right, _KustoType.DATETIME)
 
     def __lt__(self, other: DatetimeType) -> _BooleanExpression:
         return _BooleanExpression.binary_op(self, ' < ', other)
@@ -689,7 +698,7 @@ class _DatetimeExpression(BaseExpression):
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/startofyearfunction
         """
-        return _DatetimeExpression(KQL(f'startofyear({self.kql})' if offset is None else 'startofyear({self.kql}, {to_kql(offset)})'))
+        return _DatetimeExpression(KQL(f'startofyear({self.kql})' if offset is None else f'startofyear({self.kql}, {_to_kql(offset)})'))
 
     def day_of_week(self) -> '_TimespanExpression':
         """
@@ -700,10 +709,12 @@ class _DatetimeExpression(BaseExpression):
 
 @_plain_expression(_KustoType.TIMESPAN)
 class _TimespanExpression(BaseExpression):
+    __slots__ = ()
+
     @staticmethod
     def binary_op(left: ExpressionType, operator: str, right: ExpressionType) -> '_TimespanExpression':
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(left, operator, right, _KustoType.TIMESPAN)
+        return _binary_op(left, operator, right, _KustoType.TIMESPAN)
 
     def __add__(self, other: TimespanType) -> '_TimespanExpression':
         # https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/datetime-timespan-arithmetic
@@ -771,6 +782,8 @@ class _TimespanExpression(BaseExpression):
 
 
 class _BaseDynamicExpression(BaseExpression):
+    __slots__ = ()
+
     # We would prefer to use 'abc' to make the class abstract, but this can be done only if there is at least one
     # abstract method, which we don't have here. Overriding __new___ is the next best solution.
     def __new__(cls, *args, **kwargs) -> '_BaseDynamicExpression':
@@ -795,6 +808,8 @@ class _BaseDynamicExpression(BaseExpression):
 
 @_plain_expression(_KustoType.ARRAY)
 class _ArrayExpression(_BaseDynamicExpression):
+    __slots__ = ()
+
     def __getitem__(self, index: NumberType) -> 'AnyExpression':
         return super().__getitem__(index)
 
@@ -819,6 +834,8 @@ class _ArrayExpression(_BaseDynamicExpression):
 
 @_plain_expression(_KustoType.MAPPING)
 class _MappingExpression(_BaseDynamicExpression):
+    __slots__ = ()
+
     def __getitem__(self, index: StringType) -> 'AnyExpression':
         return super().__getitem__(index)
 
@@ -841,11 +858,15 @@ class _MappingExpression(_BaseDynamicExpression):
 
 
 class _DynamicExpression(_ArrayExpression, _MappingExpression):
+    __slots__ = ()
+
     def __getitem__(self, index: Union[StringType, NumberType]) -> 'AnyExpression':
         return _BaseDynamicExpression.__getitem__(self, index)
 
 
 class _ComparableExpression(_NumberExpression, _DatetimeExpression, _TimespanExpression):
+    __slots__ = ()
+
     # TODO: Implement for strings using 'strcmp': https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/strcmpfunction
     def __lt__(self, other: ComparableType) -> _BooleanExpression:
         return _BooleanExpression.binary_op(self, ' < ', other)
@@ -861,10 +882,11 @@ class _ComparableExpression(_NumberExpression, _DatetimeExpression, _TimespanExp
 
 
 class AnyExpression(_BooleanExpression, _ComparableExpression, _StringExpression, _DynamicExpression):
-    pass
+    __slots__ = ()
 
 
 class AggregationExpression(BaseExpression):
+    __slots__ = ()
 
     # We would prefer to use 'abc' to make the class abstract, but this can be done only if there is at least one
     # abstract method, which we don't have here. Overriding __new___ is the next best solution.
@@ -886,41 +908,41 @@ class AggregationExpression(BaseExpression):
 
 @_aggregation_expression(_KustoType.BOOL)
 class _BooleanAggregationExpression(AggregationExpression, _BooleanExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(*_NUMBER_TYPES)
 class _NumberAggregationExpression(AggregationExpression, _NumberExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(_KustoType.STRING, _KustoType.GUID)
 class _StringAggregationExpression(AggregationExpression, _StringExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(_KustoType.DATETIME)
 class _DatetimeAggregationExpression(AggregationExpression, _DatetimeExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(_KustoType.TIMESPAN)
 class _TimespanAggregationExpression(AggregationExpression, _TimespanExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(_KustoType.ARRAY)
 class _ArrayAggregationExpression(AggregationExpression, _ArrayExpression):
-    pass
+    __slots__ = ()
 
 
 @_aggregation_expression(_KustoType.MAPPING)
 class _MappingAggregationExpression(AggregationExpression, _MappingExpression):
-    pass
+    __slots__ = ()
 
 
 class _AnyAggregationExpression(AggregationExpression, AnyExpression):
-    pass
+    __slots__ = ()
 
 
 class _AssignmentBase:
@@ -959,6 +981,7 @@ class _AssignmentFromAggregationToColumn(_AssignmentBase):
 
 
 class BaseColumn(BaseExpression):
+    __slots__ = ('_name',)
     _name: str
 
     # We would prefer to use 'abc' to make the class abstract, but this can be done only if there is at least one
@@ -991,44 +1014,46 @@ class BaseColumn(BaseExpression):
 
 @_typed_column(*_NUMBER_TYPES)
 class _NumberColumn(BaseColumn, _NumberExpression):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.BOOL)
 class _BooleanColumn(BaseColumn, _BooleanExpression):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.ARRAY)
 class _ArrayColumn(BaseColumn, _ArrayExpression):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.MAPPING)
 class _MappingColumn(BaseColumn, _MappingExpression):
-    pass
+    __slots__ = ()
 
 
 class _DynamicColumn(_ArrayColumn, _MappingColumn):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.STRING, _KustoType.GUID)
 class _StringColumn(BaseColumn, _StringExpression):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.DATETIME)
 class _DatetimeColumn(BaseColumn, _DatetimeExpression):
-    pass
+    __slots__ = ()
 
 
 @_typed_column(_KustoType.TIMESPAN)
 class _TimespanColumn(BaseColumn, _TimespanExpression):
-    pass
+    __slots__ = ()
 
 
 class _SubtractableColumn(_NumberColumn, _DatetimeColumn, _TimespanColumn, _ComparableExpression):
+    __slots__ = ()
+
     @staticmethod
     def __resolve_type(type_to_resolve: Union['NumberType', 'DatetimeType', 'TimespanType']) -> Optional[_KustoType]:
         # noinspection PyTypeChecker
@@ -1052,7 +1077,7 @@ class _SubtractableColumn(_NumberColumn, _DatetimeColumn, _TimespanColumn, _Comp
         # Otherwise: subtracting a number can only result in a number
 
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(self, ' - ', other, resolved_type)
+        return _binary_op(self, ' - ', other, resolved_type)
 
     def __rsub__(self, other: Union['NumberType', 'DatetimeType', 'TimespanType']) -> Union['_NumberExpression', '_TimespanExpression', 'AnyExpression']:
         resolved_type = self.__resolve_type(other)
@@ -1062,11 +1087,11 @@ class _SubtractableColumn(_NumberColumn, _DatetimeColumn, _TimespanColumn, _Comp
         # Otherwise: subtracting from a number or a timespan can only result in a number or a timespan respectively
 
         # noinspection PyTypeChecker
-        return BaseExpression.base_binary_op(other, ' - ', self, resolved_type)
+        return _binary_op(other, ' - ', self, resolved_type)
 
 
 class _AnyTypeColumn(_SubtractableColumn, _BooleanColumn, _DynamicColumn, _StringColumn):
-    pass
+    __slots__ = ()
 
 
 class ColumnGenerator:
@@ -1090,6 +1115,8 @@ column_generator = ColumnGenerator()
 
 
 class _ColumnToType(BaseExpression):
+    __slots__ = ()
+
     def __init__(self, col: BaseColumn, kusto_type: _KustoType) -> None:
         super().__init__(KQL(f"{col.kql} to typeof({kusto_type.primary_name})"))
 
@@ -1110,6 +1137,17 @@ def _to_kql(obj: ExpressionType, parentheses: bool = False) -> KQL:
     return _kql_converter.for_obj(obj)
 
 
+def _binary_op(left: ExpressionType, operator: str, right: ExpressionType, result_type: Optional[_KustoType]) -> BaseExpression:
+    # A plain function rather than a static method, since it is called for every operator
+    registrar = _plain_expression
+    fallback = AnyExpression
+    if isinstance(left, AggregationExpression) or isinstance(right, AggregationExpression):
+        registrar = _aggregation_expression
+        fallback = _AnyAggregationExpression
+    return_type = fallback if result_type is None else registrar.registry[result_type]
+    return return_type(KQL(f'{_to_kql(left, True)}{operator}{_to_kql(right, True)}'))
+
+
 def _expression_to_type(expression: ExpressionType, type_registrar: _TypeRegistrar, fallback_type: Any) -> Any:
     types = set(type_registrar.registry[base_type] for base_type in _plain_expression.get_base_types(expression))
     return next(iter(types)) if len(types) == 1 else fallback_type
@@ -1,4 +1,5 @@
 from itertools import chain
+from operator import attrgetter
 from typing import Union, List, Pattern, Type
 
 from .enums import Kind
@@ -13,6 +14,18 @@ from .logger import _logger
 from .type_utils import _plain_expression, _KustoType, _PYTHON_TYPE_TO_KUSTO_TYPE
 
 
+# Expressions are immutable, so argument-free calls can share a single instance built at import time
+_INGESTION_TIME = _DatetimeExpression(KQL('ingestion_time()'))
+_NOW = _DatetimeExpression(KQL('now()'))
+_PACK_ALL = _MappingExpression(KQL('pack_all()'))
+_RAND = _NumberExpression(KQL('rand()'))
+_ANY_ALL = _AnyAggregationExpression(KQL('any(*)'))
+_COUNT = _NumberAggregationExpression(KQL('count()'))
+_TAKE_ANY_ALL = _AnyAggregationExpression(KQL('take_any(*)'))
+
+_get_kql = attrgetter('kql')
+
+
 class Functions:
     """
     Recommended import style:\n
@@ -421,7 +434,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/ingestiontimefunction
         """
-        return _DatetimeExpression(KQL('ingestion_time()'))
+        return _INGESTION_TIME
 
     @staticmethod
     def is_empty(expr: ExpressionType) -> _BooleanExpression:
@@ -563,7 +576,7 @@ class Functions:
         """
         if offset:
             return _DatetimeExpression(KQL(f'now({_to_kql(offset)})'))
-        return _DatetimeExpression(KQL('now()'))
+        return _NOW
 
     @staticmethod
     def pack(**kwargs: ExpressionType) -> _MappingExpression:
@@ -577,7 +590,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/packallfunction
         """
-        return _MappingExpression(KQL("pack_all()"))
+        return _PACK_ALL
 
     @staticmethod
     def pack_array(*elements: ExpressionType) -> '_ArrayExpression':
@@ -652,7 +665,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/randfunction
         """
-        return _NumberExpression(KQL("rand()") if n is None else f'rand({_to_kql(n)})')
+        return _RAND if n is None else _NumberExpression(KQL(f'rand({_to_kql(n)})'))
 
     # def range(self): return
     #
@@ -929,10 +942,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/strcat-delimfunction
         """
-        res = f'strcat_delim({_to_kql(delimiter)}, {_to_kql(expr1)}, {_to_kql(expr2)}'
-        if len(expressions) > 0:
-            res = res + ', ' + ', '.join(_to_kql(expr) for expr in expressions)
-        return _StringExpression(KQL(res + ')'))
+        return _StringExpression(KQL(f"strcat_delim({', '.join(_to_kql(expr) for expr in chain((delimiter, expr1, expr2), expressions))})"))
 
     @staticmethod
     def strcmp(expr1: StringType, expr2: StringType) -> _NumberExpression:
@@ -1029,7 +1039,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/tohexfunction
         """
-        return _StringExpression(KQL(f'tohex({_to_kql(expr1)})' if expr2 is None else 'tohex({to_kql(expr1)}, {to_kql(expr2)})'))
+        return _StringExpression(KQL(f'tohex({_to_kql(expr1)})' if expr2 is None else f'tohex({_to_kql(expr1)}, {_to_kql(expr2)})'))
 
     @staticmethod
     def to_int(expr: ExpressionType) -> _NumberExpression:
@@ -1148,8 +1158,8 @@ class Functions:
         :param args: The expressions to return for the chosen record. An empty list will cause all columns to be returned.
         """
         if len(args) == 0:
-            return _AnyAggregationExpression(KQL("any(*)"))
-        return _AnyAggregationExpression(KQL(f"any({', '.join(arg.kql for arg in args)})"))
+            return _ANY_ALL
+        return _AnyAggregationExpression(KQL(f"any({', '.join(map(_get_kql, args))})"))
 
     @staticmethod
     def any_if(expr: ExpressionType, predicate: BooleanType) -> _AnyAggregationExpression:
@@ -1166,8 +1176,8 @@ class Functions:
         :param args: The expressions to return for the chosen record. An empty list will cause all columns to be returned.
         """
         if len(args) == 0:
-            return _AnyAggregationExpression(KQL(f"arg_max({expr_to_maximize}, *)"))
-        return _AnyAggregationExpression(KQL(f"arg_max({expr_to_maximize}, {', '.join(arg.kql for arg in args)})"))
+            return _AnyAggregationExpression(KQL(f"arg_max({_to_kql(expr_to_maximize)}, *)"))
+        return _AnyAggregationExpression(KQL(f"arg_max({_to_kql(expr_to_maximize)}, {', '.join(map(_get_kql, args))})"))
 
     @staticmethod
     def arg_min(expr_to_minimize: ExpressionType, *args: ExpressionType) -> _AnyAggregationExpression:
@@ -1177,8 +1187,8 @@ class Functions:
         :param args: The expressions to return for the chosen record. An empty list will cause all columns to be returned.
         """
         if len(args) == 0:
-            return _AnyAggregationExpression(KQL(f"arg_min({expr_to_minimize}, *)"))
-        return _AnyAggregationExpression(KQL(f"arg_min({expr_to_minimize}, {', '.join(arg.kql for arg in args)})"))
+            return _AnyAggregationExpression(KQL(f"arg_min({_to_kql(expr_to_minimize)}, *)"))
+        return _AnyAggregationExpression(KQL(f"arg_min({_to_kql(expr_to_minimize)}, {', '.join(map(_get_kql, args))})"))
 
     @staticmethod
     def avg(expr: ExpressionType) -> _NumberAggregationExpression:
@@ -1202,7 +1212,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/count-aggfunction
         """
-        return _NumberAggregationExpression(KQL("count()" if col is None else f"count({col.kql})"))
+        return _COUNT if col is None else _NumberAggregationExpression(KQL(f"count({col.kql})"))
 
     @staticmethod
     def count_if(predicate: BooleanType) -> _NumberAggregationExpression:
@@ -1298,7 +1308,7 @@ class Functions:
         """
         https://docs.microsoft.com/en-us/azure/data-explorer/kusto/query/take-any-aggfunction
         """
-        return _AnyAggregationExpression(KQL('take_any(*)'))
+        return _TAKE_ANY_ALL
 
     @staticmethod
     def max(expr: ExpressionType) -> _AnyAggregationExpression:
@@ -2,13 +2,13 @@ from abc import ABCMeta, abstractmethod
 from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 from itertools import chain
 from threading import Lock
-from typing import Union, Dict, Any, Iterable, Callable, Generator, Optional
+from typing import Union, Dict, Any, Iterable, Callable, Optional, KeysView, ValuesView
 
 from .logger import _logger
 
 # Using a thread pool even though we only need one thread, because that's the only way to make use of "futures".
 # Also, this makes it easy to use more than one thread, if the need ever arises.
-_POOL = ThreadPoolExecutor(max_workers=1)
+_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pykusto-fetch')
 
 _DEFAULT_GET_ITEM_TIMEOUT_SECONDS = 3
 _DEFAULT_DIR_TIMEOUT_SECONDS = 3
@@ -18,11 +18,14 @@ class _ItemFetcher(metaclass=ABCMeta):
     """
     Abstract class that caches a collection of items, fetching them in certain scenarios.
     """
+    __slots__ = ('_fetch_by_default', '__fetched', '__items', '__future', '__items_lock', '__weakref__')
     _fetch_by_default: bool
     __fetched: bool
     __items: Union[None, Dict[str, Any]]
     __future: Union[None, Future]
-    __items_lock: Lock
+    __items_lock: Optional[Lock]
+    # Guards the lazy creation of the per-instance lock
+    __items_lock_creation_lock = Lock()
 
     def __init__(self, items: Optional[Dict[str, Any]], fetch_by_default: bool) -> None:
         """
@@ -34,7 +37,17 @@ class _ItemFetcher(metaclass=ABCMeta):
         self.__items = items
         self.__fetched = self.__items is not None
         self.__future = None
-        self.__items_lock = Lock()
+        # Most instances never generate or fetch items, so the lock is created only when first needed
+        self.__items_lock = None
+
+    def __get_items_lock(self) -> Lock:
+        lock = self.__items_lock
+        if lock is None:
+            with _ItemFetcher.__items_lock_creation_lock:
+                if self.__items_lock is None:
+                    self.__items_lock = Lock()
+                lock = self.__items_lock
+        return lock
 
     def _items_fetched(self) -> bool:
         return self.__fetched
@@ -43,15 +56,17 @@ class _ItemFetcher(metaclass=ABCMeta):
         if not self.__fetched and self._fetch_by_default:
             self.refresh()
 
-    def _get_item_names(self) -> Generator[str, None, None]:
+    def __ensure_fetched(self) -> Dict[str, Any]:
+        # Once fetched, this is a single flag check; reading the flag needs no lock
         if not self.__fetched:
             self.blocking_refresh()
-        yield from self.__items.keys()
+        return self.__items
 
-    def _get_items(self) -> Generator[Any, None, None]:
-        if not self.__fetched:
-            self.blocking_refresh()
-        yield from self.__items.values()
+    def _get_item_names(self) -> KeysView[str]:
+        return self.__ensure_fetched().keys()
+
+    def _get_items(self) -> ValuesView[Any]:
+        return self.__ensure_fetched().values()
 
     @abstractmethod
     def _new_item(self, name: str) -> Any:
@@ -68,6 +83,9 @@ class _ItemFetcher(metaclass=ABCMeta):
         :return: The item with the given name
         :raises AttributeError: If there is no such item
         """
+        if name.startswith('_') and name.endswith('_'):
+            # Dunder and IPython probes (e.g. '_repr_html_') are never items, so don't wait for a fetch
+            raise AttributeError(f"{self} has no attribute '{name}'")
         return self._get_item(name, lambda: _raise(AttributeError(f"{self} has no attribute '{name}'")))
 
     def __getitem__(self, name: str) -> Any:
@@ -81,7 +99,13 @@ class _ItemFetcher(metaclass=ABCMeta):
         return self._get_item(name, lambda: self.__generate_and_save_new_item(name))
 
     def __generate_and_save_new_item(self, name: str) -> Any:
-        with self.__items_lock:
+        # Lock-free fast path for an item which already exists (dict reads are atomic under the GIL)
+        items = self.__items
+        if items is not None:
+            item = items.get(name)
+            if item is not None:
+                return item
+        with self.__get_items_lock():
             if self.__items is None:
                 self.__items = {}
             item = self.__items.get(name)
@@ -117,7 +141,9 @@ class _ItemFetcher(metaclass=ABCMeta):
             except Exception:
                 # Since this method is often called in the background, we don't want to raise exceptions
                 _logger.exception("Exception while fetching items for __dir__ method")
-        return sorted(chain(super().__dir__(), tuple() if self.__items is None else filter(lambda name: '.' not in name, self.__items.keys())))
+        items = self.__items
+        item_names = [] if items is None else [name for name in items if '.' not in name]
+        return sorted(chain(super().__dir__(), item_names))
 
     def refresh(self) -> None:
         """
@@ -149,7 +175,7 @@ class _ItemFetcher(metaclass=ABCMeta):
     def __fetch_items(self) -> None:
         fetched_items = self._internal_get_items()
         assert fetched_items is not None
-        with self.__items_lock:
+        with self.__get_items_lock():
             self.__items = fetched_items
             self.__fetched = True
 
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from itertools import chain
 from numbers import Number
 from typing import NewType, Union, Mapping, List, Tuple, Any
@@ -14,7 +15,9 @@ def _datetime_to_kql(dt: datetime) -> KQL:
     return KQL(dt.strftime('datetime(%Y-%m-%d %H:%M:%S.%f)'))
 
 
+# Queries tend to reuse the same few offsets and bin sizes, and timedeltas are immutable
 @_kql_converter(_KustoType.TIMESPAN)
+@lru_cache(maxsize=256)
 def _timedelta_to_kql(td: timedelta) -> KQL:
     hours, remainder = divmod(td.seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
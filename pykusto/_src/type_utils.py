@@ -78,6 +78,7 @@ class _TypeRegistrar:
     """
     name: str
     registry: Dict[_KustoType, Union[Type, Callable]]
+    _callable_by_python_type: Dict[Type, Union[Type, Callable]]
 
     def __init__(self, name: str) -> None:
         """
@@ -85,6 +86,8 @@ class _TypeRegistrar:
         """
         self.name = name
         self.registry = {}
+        # Resolving an object goes through the entire registry, so the result is cached per Python type
+        self._callable_by_python_type = {}
 
     def __repr__(self) -> str:
         return self.name
@@ -95,6 +98,7 @@ class _TypeRegistrar:
                 previous = self.registry.setdefault(t, wrapped)
                 if previous is not wrapped:
                     raise TypeError(f"{self}: type already registered: {t.primary_name}")
+            self._callable_by_python_type.clear()
             return wrapped
 
         return inner
@@ -107,10 +111,16 @@ class _TypeRegistrar:
         :param obj: An object of Kusto type
         :return: Associated python object
         """
-        for registered_type, registered_callable in self.registry.items():
-            if registered_type.is_type_of(obj):
-                return registered_callable(obj)
-        raise ValueError(f"{self}: no registered callable for object {obj} of type {type(obj).__name__}")
+        python_type = type(obj)
+        registered_callable = self._callable_by_python_type.get(python_type)
+        if registered_callable is None:
+            for registered_type, candidate_callable in self.registry.items():
+                if registered_type.is_type_of(obj):
+                    registered_callable = self._callable_by_python_type.setdefault(python_type, candidate_callable)
+                    break
+            else:
+                raise ValueError(f"{self}: no registered callable for object {obj} of type {python_type.__name__}")
+        return registered_callable(obj)
 
     def for_type(self, t: Type) -> Union[Type, Callable]:
         """
@@ -1,4 +1,5 @@
-from threading import Thread, Lock
+import weakref
+from threading import Thread, Lock, current_thread
 from typing import Any, Callable, List
 from unittest.mock import patch
 
@@ -8,6 +9,8 @@ from pykusto._src.client_base import Database
 # noinspection PyProtectedMember
 from pykusto._src.expressions import _StringColumn, _NumberColumn, _AnyTypeColumn, _BooleanColumn
 # noinspection PyProtectedMember
+from pykusto._src.item_fetcher import _POOL
+# noinspection PyProtectedMember
 from pykusto._src.type_utils import _KustoType
 from test.test_base import TestBase, MockKustoClient, RecordedQuery, mock_tables_response, mock_getschema_response, mock_databases_response
 
@@ -55,6 +58,7 @@ class TestClientFetch(TestBase):
         mock_client = MockKustoClient(block=True, record_metadata=True)
         client = PyKustoClient(mock_client)
         self.query_in_background(client.get_databases_names)
+        mock_client.wait_until_blocked()
         mock_client.release()
         client.wait_for_items()
         # Make sure the fetch query was indeed called
@@ -65,6 +69,7 @@ class TestClientFetch(TestBase):
         mock_client = MockKustoClient(block=True, record_metadata=True)
         client = PyKustoClient(mock_client)
         self.query_in_background(lambda: dir(client))
+        mock_client.wait_until_blocked()
         # Return the fetch
         mock_client.release()
         client.wait_for_items()
@@ -92,7 +97,8 @@ class TestClientFetch(TestBase):
         try:
             PyKustoClient(mock_client)['test_db']['mock_table']
         finally:
-            # # Return the fetch
+            mock_client.wait_until_blocked()
+            # Return the fetch
             mock_client.release()
 
     def test_query_before_fetch_returned(self):
@@ -278,3 +284,34 @@ class TestClientFetch(TestBase):
             Exception("Mock exception"),
             lambda: set(client.get_databases_names()),
         )
+
+    def test_fetch_pool_thread_name(self):
+        self.assertEqual('pykusto-fetch', _POOL.submit(lambda: current_thread().name).result().rsplit('_', 1)[0])
+
+    def test_generated_item_is_reused(self):
+        client = PyKustoClient(MockKustoClient(), fetch_by_default=False)
+        self.assertIs(client['test_db'], client['test_db'])
+
+    def test_probe_attribute_does_not_wait_for_fetch(self):
+        mock_client = MockKustoClient(block=True)
+        client = PyKustoClient(mock_client)
+        mock_client.wait_until_blocked()
+        try:
+            with patch.object(PyKustoClient, 'blocking_refresh') as blocking_refresh:
+                self.assertFalse(hasattr(client, '_ipython_canary_method_should_not_exist_'))
+            blocking_refresh.assert_not_called()
+        finally:
+            mock_client.release()
+            client.wait_for_items()
+
+    def test_database_and_table_have_no_instance_dict(self):
+        table = PyKustoClient(MockKustoClient(), fetch_by_default=False)['test_db']['mock_table']
+        self.assertEqual(0, type(table).__dictoffset__)
+        self.assertEqual(0, type(table['foo']).__dictoffset__)
+        self.assertEqual(0, Database.__dictoffset__)
+
+    def test_database_and_table_support_weak_references(self):
+        database = PyKustoClient(MockKustoClient(), fetch_by_default=False)['test_db']
+        table = database['mock_table']
+        self.assertIs(database, weakref.ref(database)())
+        self.assertIs(table, weakref.ref(table)())
@@ -1,3 +1,4 @@
+import weakref
 from datetime import timedelta, datetime
 
 import pytest
@@ -5,7 +6,7 @@ import pytest
 from pykusto import Functions as f
 from pykusto import column_generator as col, Query
 # noinspection PyProtectedMember
-from pykusto._src.expressions import _AnyTypeColumn
+from pykusto._src.expressions import _AnyTypeColumn, BaseExpression, AnyExpression, _BooleanExpression
 from test.test_base import TestBase, mock_table as t
 
 
@@ -64,6 +65,10 @@ class TestExpressions(TestBase):
             repr(t.stringField == 'bar')
         )
 
+    def test_str(self):
+        self.assertEqual('foo.bar', str(col['foo.bar']))
+        self.assertEqual("['foo.bar']", col['foo.bar'].kql)
+
     def test_to_bool(self):
         self.assertEqual(
             ' | extend boolFoo = tobool(stringField)',
@@ -88,6 +93,14 @@ class TestExpressions(TestBase):
             Query().where(t.boolField & t.stringField.contains("hello")).render(),
         )
 
+    def test_and_literal(self):
+        expression = t.boolField & True
+        self.assertType(expression, _BooleanExpression)
+        self.assertEqual(
+            ' | where boolField and true',
+            Query().where(expression).render(),
+        )
+
     def test_swapped_and(self):
         self.assertEqual(
             ' | where true and boolField',
@@ -100,6 +113,14 @@ class TestExpressions(TestBase):
             Query().where(t.boolField | t.stringField.contains("hello")).render(),
         )
 
+    def test_or_literal(self):
+        expression = t.boolField | False
+        self.assertType(expression, _BooleanExpression)
+        self.assertEqual(
+            ' | where boolField or false',
+            Query().where(expression).render(),
+        )
+
     def test_swapped_or(self):
         self.assertEqual(
             ' | where false or boolField',
@@ -564,3 +585,32 @@ class TestExpressions(TestBase):
             ),
             lambda: (t.boolField and t.numField > 10)
         )
+
+    def test_subexpression_is_cached(self):
+        expression = f.parse_json(t.stringField)
+        first = expression.as_subexpression()
+        self.assertEqual('(parse_json(stringField))', first)
+        self.assertIs(first, expression.as_subexpression())
+        # Attribute access on a mapping must still yield a sub-field, and not the cached slot
+        self.assertEqual(
+            ' | where (parse_json(stringField).foo) == "bar"',
+            Query().where(expression.foo == 'bar').render(),
+        )
+        self.assertEqual(
+            ' | where (mapField._sub) == "x"',
+            Query().where(t.mapField._sub == 'x').render(),
+        )
+
+    def test_expressions_have_no_instance_dict(self):
+        for expression in (t.numField + 1, t.stringField, f.parse_json(t.stringField), f.sum(t.numField), col.foo):
+            # Checked on the type, since attribute access on a dynamic expression yields a sub-field
+            self.assertEqual(0, type(expression).__dictoffset__, type(expression).__name__)
+
+    def test_expressions_support_weak_references(self):
+        for expression in (t.numField + 1, t.stringField, f.parse_json(t.stringField), f.sum(t.numField), col.foo):
+            self.assertIs(expression, weakref.ref(expression)())
+
+    def test_base_binary_op(self):
+        expression = BaseExpression.base_binary_op(t.numField, ' + ', 1, None)
+        self.assertType(expression, AnyExpression)
+        self.assertEqual('numField + 1', expression.kql)
@@ -456,6 +456,10 @@ class TestFunction(TestBase):
             " | where (startofyear(dateField)) > datetime(2019-01-01 00:00:00.000000)",
             Query().where(f.start_of_year(t.dateField) > datetime(2019, 1, 1)).render()
         )
+        self.assertEqual(
+            " | where (startofyear(dateField, 2)) > datetime(2019-01-01 00:00:00.000000)",
+            Query().where(f.start_of_year(t.dateField, 2) > datetime(2019, 1, 1)).render()
+        )
 
     def test_strcat(self):
         self.assertEqual(
@@ -626,6 +630,10 @@ class TestFunction(TestBase):
             ' | where (tohex(256)) == "100"',
             Query().where(f.to_hex(256) == "100").render()
         )
+        self.assertEqual(
+            ' | where (tohex(-256, 8)) == "ffffff00"',
+            Query().where(f.to_hex(-256, 8) == "ffffff00").render()
+        )
 
     def test_trim(self):
         self.assertEqual(
@@ -707,6 +715,12 @@ class TestFunction(TestBase):
             Query().summarize(f.arg_min(t.stringField)).render()
         )
 
+    def test_arg_max_arg_min_quoted_column(self):
+        self.assertEqual(
+            " | summarize arg_max(['foo.bar'], *), arg_min(['foo.bar'], *)",
+            Query().summarize(f.arg_max(col['foo.bar']), f.arg_min(col['foo.bar'])).render()
+        )
+
     def test_avg(self):
         self.assertEqual(
             " | summarize avg(numField)",
@@ -866,6 +880,13 @@ class TestFunction(TestBase):
             Query().summarize(f.take_any(t.numField, t.stringField, t.boolField)).render()
         )
 
+    def test_count_is_shared(self):
+        self.assertIs(f.count(), f.count())
+        self.assertEqual(
+            " | summarize foo = count(), bar = count()",
+            Query().summarize(foo=f.count(), bar=f.count()).render()
+        )
+
     def test_take_any_all(self):
         self.assertEqual(
             " | summarize take_any(*)",
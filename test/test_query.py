@@ -322,6 +322,15 @@ class TestQuery(TestBase):
             Query(t).summarize(f.count(t.stringField), my_count=f.count(t.stringField2)).render(),
         )
 
+    def test_summarize_by_literal_is_converted_on_assignment(self):
+        values = [1, 2]
+        query = Query(t).summarize(f.count()).by(foo=values)
+        values.append(3)
+        self.assertEqual(
+            'mock_table | summarize count() by foo = dynamic([1, 2])',
+            query.render(),
+        )
+
     def test_summarize_by(self):
         self.assertEqual(
             "mock_table | summarize count(stringField), my_count = count(stringField2) by boolField, bin(numField, 1), time_range = bin(dateField, time(0.0:0:10.0))",
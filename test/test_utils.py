@@ -1,8 +1,11 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 # noinspection PyProtectedMember
 from pykusto import ClientRequestProperties
 from pykusto._src.expressions import _to_kql
 # noinspection PyProtectedMember
-from pykusto._src.kql_converters import KQL
+from pykusto._src.kql_converters import KQL, _timedelta_to_kql
 # noinspection PyProtectedMember
 from pykusto._src.type_utils import _TypeRegistrar, _KustoType
 from test.test_base import TestBase
@@ -22,6 +25,20 @@ class TestUtils(TestBase):
             _to_kql(test_dict)
         )
 
+    def test_bool_to_kql(self):
+        # Converting an int first must not make bools resolve through the int converter
+        self.assertEqual('1', _to_kql(1))
+        self.assertEqual('true', _to_kql(True))
+        self.assertEqual('false', _to_kql(False))
+        self.assertEqual('0', _to_kql(0))
+
+    def test_timedelta_to_kql_cached(self):
+        _timedelta_to_kql.cache_clear()
+        self.assertEqual('time(1.2:3:4.5)', _to_kql(timedelta(days=1, hours=2, minutes=3, seconds=4, microseconds=5)))
+        self.assertEqual('time(1.2:3:4.5)', _to_kql(timedelta(days=1, hours=2, minutes=3, seconds=4, microseconds=5)))
+        self.assertEqual('time(0.0:0:0.0)', _to_kql(timedelta()))
+        self.assertEqual((1, 2), _timedelta_to_kql.cache_info()[:2])
+
     def test_type_registrar_for_type(self):
         test_annotation = _TypeRegistrar("Test annotation")
 
@@ -102,3 +119,26 @@ class TestUtils(TestBase):
             ValueError("Value should not be empty"),
             lambda: properties.set_option(' ', True)
         )
+
+    def test_type_registrar_for_obj_cached_per_type(self):
+        test_annotation = _TypeRegistrar("Test annotation")
+
+        @test_annotation(_KustoType.STRING)
+        def str_annotated(s: str) -> str:
+            return "string " + s
+
+        self.assertEqual("string first", test_annotation.for_obj("first"))
+        self.assertEqual({str: str_annotated}, test_annotation._callable_by_python_type)
+        # A repeated lookup for the same Python type must not scan the registry again
+        with patch.object(_KustoType, 'is_type_of', side_effect=AssertionError("Registry scanned")):
+            self.assertEqual("string second", test_annotation.for_obj("second"))
+
+        # A later registration must not be shadowed by the cache
+        @test_annotation(_KustoType.BOOL)
+        def bool_annotated(b: bool) -> str:
+            return "bool " + str(b)
+
+        self.assertEqual({}, test_annotation._callable_by_python_type)
+        self.assertEqual("bool True", test_annotation.for_obj(True))
+        self.assertEqual("string third", test_annotation.for_obj("third"))
+        self.assertEqual({bool: bool_annotated, str: str_annotated}, test_annotation._callable_by_python_type)